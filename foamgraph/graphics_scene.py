@@ -2,7 +2,7 @@ from enum import Enum
 import time
 import weakref
 
-from .backend.QtCore import pyqtSignal, QLineF, QRect, Qt
+from .backend.QtCore import pyqtSignal, QLineF, QRect, QRectF, Qt, QTimer
 from .backend.QtWidgets import QGraphicsScene, QGraphicsSceneMouseEvent
 
 
@@ -13,6 +13,26 @@ class MouseEventState(Enum):
     EXIT = 3
 
 
+# Bit flags of the mouse event handlers implemented by an item class.
+_HOVER_EVENT = 1
+_MOUSE_DRAG_EVENT = 2
+_MOUSE_CLICK_EVENT = 4
+
+_event_handler_cache = {}
+
+
+def _eventHandlers(item) -> int:
+    """Return the bit flags of the mouse event handlers of the item."""
+    cls = type(item)
+    flags = _event_handler_cache.get(cls)
+    if flags is None:
+        flags = ((_HOVER_EVENT if hasattr(cls, 'hoverEvent') else 0) |
+                 (_MOUSE_DRAG_EVENT if hasattr(cls, 'mouseDragEvent') else 0) |
+                 (_MOUSE_CLICK_EVENT if hasattr(cls, 'mouseClickEvent') else 0))
+        _event_handler_cache[cls] = flags
+    return flags
+
+
 class MouseDragEvent:
     """Mouse event delivered by :class:`GraphicsScene` when a item is dragged.
     """
@@ -437,10 +457,12 @@ class GraphicsScene(QGraphicsScene):
        move in a drag.
     """
     # Emitted a list of objects under the cursor when the mouse is
-    # moved over the scene.
+    # moved over the scene. Emissions are coalesced so that the signal
+    # is emitted at most once per event loop iteration.
     mouse_hover_sgn = pyqtSignal(object)
     # Emitted when the mouse cursor moves over the scene. The position
-    # is given in the scene coordinate system.
+    # is given in the scene coordinate system. Emissions are coalesced
+    # in the same way as mouse_hover_sgn.
     mouse_moved_sgn = pyqtSignal(object)
     # Emitted when the mouse is clicked over the scene. Use ev.pos() to
     # get the click position relative to the item that was clicked on,
@@ -453,13 +475,46 @@ class GraphicsScene(QGraphicsScene):
         self._move_distance = 5
 
         self.click_events = []
-        self.drag_buttons = []
+        self.drag_buttons = set()
         self.drag_item = None
         self.last_drag = None
         self.hover_items = weakref.WeakKeyDictionary()
         self.last_hover_event = None
         self.min_drag_time = 0.5  # drags shorter than 0.5 sec are interpreted as clicks
 
+        # item -> (bounding rect, shape). A cached shape is only reused as
+        # long as the geometry of the item is unchanged.
+        self._shape_cache = weakref.WeakKeyDictionary()
+
+        self._pending_move_pos = None
+        self._pending_hover_items = None
+        self._mouse_signal_timer = QTimer(self)
+        self._mouse_signal_timer.setSingleShot(True)
+        self._mouse_signal_timer.setInterval(0)
+        self._mouse_signal_timer.timeout.connect(self._emitMouseSignals)
+
+    def _emitMouseSignals(self) -> None:
+        pos, self._pending_move_pos = self._pending_move_pos, None
+        items, self._pending_hover_items = self._pending_hover_items, None
+        if pos is not None:
+            self.mouse_moved_sgn.emit(pos)
+        if items is not None:
+            self.mouse_hover_sgn.emit(items)
+
+    def _scheduleMouseSignals(self) -> None:
+        if not self._mouse_signal_timer.isActive():
+            self._mouse_signal_timer.start()
+
+    def _itemShape(self, item, br: QRectF):
+        cached = self._shape_cache.get(item)
+        if cached is not None and cached[0] == br:
+            return cached[1]
+
+        shape = item.shape()  # Note: default shape() returns boundingRect()
+        if shape is not None:
+            self._shape_cache[item] = (br, shape)
+        return shape
+
     def mousePressEvent(self, ev: QGraphicsSceneMouseEvent) -> None:
         """Override."""
         super().mousePressEvent(ev)
@@ -482,7 +537,8 @@ class GraphicsScene(QGraphicsScene):
         
     def mouseMoveEvent(self, ev: QGraphicsSceneMouseEvent) -> None:
         """Override."""
-        self.mouse_moved_sgn.emit(ev.scenePos())
+        self._pending_move_pos = ev.scenePos()
+        self._scheduleMouseSignals()
 
         # First allow QGraphicsScene to deliver hoverEnter/Move/ExitEvents
         super().mouseMoveEvent(ev)
@@ -490,9 +546,7 @@ class GraphicsScene(QGraphicsScene):
         # Next deliver our own HoverEvents
         self.sendHoverEvents(ev)
         
-        if ev.buttons():  # button is pressed; send mouseMoveEvents and mouseDragEvents
-            # FIXME: duplicated?
-            super().mouseMoveEvent(ev)
+        if ev.buttons():  # button is pressed; send mouseDragEvents
             if self.mouseGrabberItem() is None:
                 now = time.time()
                 init = False
@@ -510,11 +564,11 @@ class GraphicsScene(QGraphicsScene):
                             if dist == 0 or (dist < self._move_distance and now - cev.time() < self.min_drag_time):
                                 continue
                             # If this is the first button to be dragged, then init=True
-                            init = init or (len(self.drag_buttons) == 0)
-                            self.drag_buttons.append(btn)
+                            init = init or not self.drag_buttons
+                            self.drag_buttons.add(btn)
 
                 # If we have dragged buttons, deliver a drag event
-                if len(self.drag_buttons) > 0:
+                if self.drag_buttons:
                     if self.sendDragEvent(
                             ev, MouseEventState.ENTER if init
                             else MouseEventState.ON):
@@ -536,7 +590,7 @@ class GraphicsScene(QGraphicsScene):
 
         if not ev.buttons():
             self.drag_item = None
-            self.drag_buttons = []
+            self.drag_buttons.clear()
             self.click_events = []
             self.last_drag = None
 
@@ -565,12 +619,13 @@ class GraphicsScene(QGraphicsScene):
             # if we are in mid-drag, do not allow items to accept the hover event.
             event = HoverEvent(ev, not ev.buttons())
             items = self.itemsNearEvent(event, hoverable=True)
-            self.mouse_hover_sgn.emit(items)
+            self._pending_hover_items = items
+            self._scheduleMouseSignals()
             
         prev_items = list(self.hover_items.keys())
             
         for item in items:
-            if hasattr(item, 'hoverEvent'):
+            if _eventHandlers(item) & _HOVER_EVENT:
                 event.current_item = item
                 if item not in self.hover_items:
                     self.hover_items[item] = None
@@ -624,7 +679,7 @@ class GraphicsScene(QGraphicsScene):
                 for item in self.itemsNearEvent(event):
                     if not item.isVisible() or not item.isEnabled():
                         continue
-                    if hasattr(item, 'mouseDragEvent'):
+                    if _eventHandlers(item) & _MOUSE_DRAG_EVENT:
                         event.current_item = item
                         item.mouseDragEvent(event)
                         if event.isAccepted():
@@ -642,7 +697,8 @@ class GraphicsScene(QGraphicsScene):
 
     def sendClickEvent(self, ev: QGraphicsSceneMouseEvent):
         # if we are in mid-drag, click events may only go to the dragged item.
-        if self.drag_item is not None and hasattr(self.drag_item, 'MouseDragEvent'):
+        if (self.drag_item is not None
+                and _eventHandlers(self.drag_item) & _MOUSE_CLICK_EVENT):
             ev.current_item = self.drag_item
             self.drag_item.mouseClickEvent(ev)
             
@@ -659,7 +715,7 @@ class GraphicsScene(QGraphicsScene):
                 for item in self.itemsNearEvent(ev):
                     if not item.isVisible() or not item.isEnabled():
                         continue
-                    if hasattr(item, 'mouseClickEvent'):
+                    if _eventHandlers(item) & _MOUSE_CLICK_EVENT:
                         ev.current_item = item
                         item.mouseClickEvent(ev)
 
@@ -703,23 +759,35 @@ class GraphicsScene(QGraphicsScene):
         # remove items whose shape does not contain point (scene.items() apparently sucks at this)
         items2 = []
         for item in items:
-            if hoverable and not hasattr(item, 'hoverEvent'):
+            if hoverable and not _eventHandlers(item) & _HOVER_EVENT:
                 continue
             if item.scene() is not self:
                 continue
-            shape = item.shape() # Note: default shape() returns boundingRect()
+            local_point = item.mapFromScene(point)
+            br = item.boundingRect()
+            if not br.contains(local_point):
+                continue
+            shape = self._itemShape(item, br)
             if shape is None:
                 continue
-            if shape.contains(item.mapFromScene(point)):
+            if shape.contains(local_point):
                 items2.append(item)
         
         # Sort by descending Z-order (don't trust scene.itms() to do this either)
         # use 'absolute' z value, which is the sum of all item/parent ZValues
+        abs_z_values = {}
+
         def absZValue(item):
-            if item is None:
-                return 0
-            return item.zValue() + absZValue(item.parentItem())
-        
+            stack = []
+            while item is not None and item not in abs_z_values:
+                stack.append(item)
+                item = item.parentItem()
+            z = 0 if item is None else abs_z_values[item]
+            for it in reversed(stack):
+                z += it.zValue()
+                abs_z_values[it] = z
+            return z
+
         items2.sort(key=absZValue, reverse=True)
         
         return items2
@@ -0,0 +1,165 @@
+import pytest
+from unittest.mock import patch
+
+from foamgraph.backend.QtCore import QEvent, QPointF, QRectF, Qt
+from foamgraph.backend.QtGui import QMouseEvent, QPainterPath
+from foamgraph.backend.QtWidgets import (
+    QApplication, QGraphicsPathItem, QGraphicsRectItem
+)
+from foamgraph.graph_view import GraphView
+
+from . import processEvents
+
+_LEFT = Qt.MouseButton.LeftButton
+_RIGHT = Qt.MouseButton.RightButton
+_MIDDLE = Qt.MouseButton.MiddleButton
+_NO_BUTTON = Qt.MouseButton.NoButton
+
+
+def _sendMouseEvent(view, type_, pos, button, buttons):
+    ev = QMouseEvent(type_, pos, button, buttons,
+                     Qt.KeyboardModifier.NoModifier)
+    QApplication.sendEvent(view.viewport(), ev)
+
+
+@pytest.fixture
+def view():
+    view = GraphView()
+    view.show()
+    processEvents()
+    yield view
+    view.close()
+
+
+def test_drag_buttons(view):
+    scene = view.scene()
+    drag_buttons = scene.drag_buttons
+    p0 = QPointF(100, 100)
+    p1 = QPointF(150, 150)
+
+    _sendMouseEvent(view, QEvent.Type.MouseButtonPress, p0, _LEFT, _LEFT)
+    _sendMouseEvent(view, QEvent.Type.MouseButtonPress, p0, _RIGHT,
+                    _LEFT | _RIGHT)
+    assert len(scene.click_events) == 2
+    assert not scene.drag_buttons
+
+    _sendMouseEvent(view, QEvent.Type.MouseMove, p1, _NO_BUTTON,
+                    _LEFT | _RIGHT)
+    assert scene.drag_buttons == {_LEFT, _RIGHT}
+
+    # release one button while the other one is still being dragged
+    _sendMouseEvent(view, QEvent.Type.MouseButtonRelease, p1, _LEFT, _RIGHT)
+    assert scene.drag_buttons == {_RIGHT}
+    assert len(scene.click_events) == 2
+    assert scene.last_drag is not None
+
+    # release all the buttons
+    _sendMouseEvent(view, QEvent.Type.MouseButtonRelease, p1, _RIGHT,
+                    _NO_BUTTON)
+    assert not scene.drag_buttons
+    assert scene.drag_buttons is drag_buttons
+    assert not scene.click_events
+    assert scene.drag_item is None
+    assert scene.last_drag is None
+
+
+def test_items_near_event_with_shape_changed(view):
+    scene = view.scene()
+
+    class _Event:
+        def __init__(self, pos):
+            self._pos = pos
+
+        def scenePos(self):
+            return self._pos
+
+    path = QPainterPath()
+    path.addRect(QRectF(0, 0, 10, 10))
+    item = QGraphicsPathItem(path)
+    item.setZValue(1000)
+    scene.addItem(item)
+
+    ev = _Event(QPointF(1, 1))
+    assert item in scene.itemsNearEvent(ev)
+    # cached shape is reused
+    assert scene.itemsNearEvent(ev)[0] is item
+
+    path = QPainterPath()
+    path.addEllipse(QRectF(0, 0, 20, 20))
+    item.setPath(path)
+    assert item not in scene.itemsNearEvent(ev)
+    assert item in scene.itemsNearEvent(_Event(QPointF(15, 15)))
+
+
+def test_mouse_move_delivered_once_to_grabber(view):
+    scene = view.scene()
+
+    class _GrabberItem(QGraphicsRectItem):
+        def __init__(self, *args):
+            super().__init__(*args)
+            self.n_moves = 0
+
+        def mousePressEvent(self, ev):
+            ev.accept()
+
+        def mouseMoveEvent(self, ev):
+            self.n_moves += 1
+
+    item = _GrabberItem(view.mapToScene(view.viewport().rect()).boundingRect())
+    item.setZValue(1000)
+    scene.addItem(item)
+
+    p0 = QPointF(100, 100)
+    _sendMouseEvent(view, QEvent.Type.MouseButtonPress, p0, _LEFT, _LEFT)
+    assert scene.mouseGrabberItem() is item
+
+    _sendMouseEvent(view, QEvent.Type.MouseMove, QPointF(150, 150),
+                    _NO_BUTTON, _LEFT)
+    assert item.n_moves == 1
+    _sendMouseEvent(view, QEvent.Type.MouseButtonRelease, p0, _LEFT,
+                    _NO_BUTTON)
+
+
+def test_click_during_drag(view):
+    scene = view.scene()
+    canvas = view._cw._canvas
+
+    p0 = view.mapFromScene(canvas.sceneBoundingRect().center())
+    p1 = p0 + QPointF(20, 20)
+    _sendMouseEvent(view, QEvent.Type.MouseButtonPress, p0, _LEFT, _LEFT)
+    _sendMouseEvent(view, QEvent.Type.MouseMove, p1, _NO_BUTTON, _LEFT)
+    assert scene.drag_item is canvas
+
+    _sendMouseEvent(view, QEvent.Type.MouseButtonPress, p1, _MIDDLE,
+                    _LEFT | _MIDDLE)
+    with patch.object(canvas, "mouseClickEvent") as mocked_click:
+        with patch.object(scene, "itemsNearEvent") as mocked_items, \
+                patch.object(scene, "sendHoverEvents"):
+            _sendMouseEvent(view, QEvent.Type.MouseButtonRelease, p1,
+                            _MIDDLE, _LEFT)
+            mocked_items.assert_not_called()
+        mocked_click.assert_called_once()
+        assert mocked_click.call_args[0][0].button() == _MIDDLE
+
+    _sendMouseEvent(view, QEvent.Type.MouseButtonRelease, p1, _LEFT,
+                    _NO_BUTTON)
+
+
+def test_mouse_signals_coalesced(view):
+    scene = view.scene()
+
+    moved = []
+    hovered = []
+    scene.mouse_moved_sgn.connect(moved.append)
+    scene.mouse_hover_sgn.connect(hovered.append)
+
+    for i in range(5):
+        _sendMouseEvent(view, QEvent.Type.MouseMove, QPointF(100 + i, 100),
+                        _NO_BUTTON, _NO_BUTTON)
+    assert not moved
+    assert not hovered
+
+    processEvents()
+    assert len(moved) == 1
+    assert moved[0] == view.mapToScene(104, 100)
+    assert len(hovered) == 1